@@ -6,7 +6,20 @@ from typing import Any
 from pydantic import BaseModel
 
 
+# Values of these exact types are emitted as-is; subclasses such as IntEnum
+# members are deliberately excluded so they still go through the Enum branch.
+_PASSTHROUGH_TYPES = frozenset({int, float, bool})
+
+
 def compute_string_delta(old: str | None, new: str) -> str:
+    """
+    Returns the part of `new` that was appended to `old`.
+
+    Consumers rebuild strings by appending deltas, so only a pure prefix
+    extension yields a suffix; any other change returns the full new string
+    (a longest-common-prefix diff would not be appendable). The prefix check is
+    a single `str.startswith` call, which compares the buffers in C.
+    """
     if not isinstance(new, str):
         return new
     old_str = old if isinstance(old, str) else ""
@@ -16,8 +29,8 @@ def compute_string_delta(old: str | None, new: str) -> str:
 
 
 def _compute_delta_recursive(prev_val: Any, current_val: Any) -> Any:
-    if current_val is None:
-        return None
+    if current_val is None or type(current_val) in _PASSTHROUGH_TYPES:
+        return current_val
     if isinstance(current_val, PythonEnum):  # Use aliased PythonEnum
         return current_val.value
     if isinstance(current_val, str):
@@ -28,12 +41,12 @@ def _compute_delta_recursive(prev_val: Any, current_val: Any) -> Any:
             old_for_string_delta = prev_val.value
         return compute_string_delta(old_for_string_delta, current_val)
     elif isinstance(current_val, list):
-        delta_list = []
         prev_list = prev_val if isinstance(prev_val, list) else []
-        for i, new_item in enumerate(current_val):
-            prev_item = prev_list[i] if i < len(prev_list) else None
-            delta_list.append(_compute_delta_recursive(prev_item, new_item))
-        return delta_list
+        prev_len = len(prev_list)
+        return [
+            _compute_delta_recursive(prev_list[i] if i < prev_len else None, new_item)
+            for i, new_item in enumerate(current_val)
+        ]
     elif isinstance(current_val, BaseModel):
         prev_model = prev_val if isinstance(prev_val, BaseModel) else None
         # Recursive call to the modified compute_delta
@@ -61,18 +74,32 @@ def compute_delta(prev: BaseModel | None, curr: BaseModel) -> dict[str, Any]:
         )
     delta_dict = {}
 
-    # MODIFICATION HERE: Iterate over keys from model_dump(exclude_unset=True)
-    # This ensures we only process fields that were explicitly set on the 'curr' model,
-    # aligning with the original behavior of "only keys present in curr dict".
-    # For Pydantic V2, exclude_unset=True is the correct flag.
-    # exclude_none=False to keep explicitly set None values
-    for field_name in curr.model_dump(exclude_unset=True, exclude_none=False):
+    # Only process fields that were explicitly set on the 'curr' model, aligning
+    # with the original behavior of "only keys present in curr dict" (explicitly
+    # set None values included). Reading model_fields_set instead of calling
+    # model_dump(exclude_unset=True) avoids serializing the whole model tree just
+    # to learn its keys, while keeping model_dump's key set and order: declared
+    # fields without exclude=True, then extra fields (extra="allow"), then
+    # computed fields, which model_dump always includes.
+    model_cls = type(curr)
+    fields_set = curr.model_fields_set
+    prev_fields = type(prev).model_fields if prev is not None else {}
+
+    field_names = [
+        name
+        for name, field_info in model_cls.model_fields.items()
+        if name in fields_set and not field_info.exclude
+    ]
+    if curr.model_extra:
+        field_names.extend(name for name in curr.model_extra if name in fields_set)
+    field_names.extend(model_cls.model_computed_fields)
+
+    for field_name in field_names:
         current_field_value = getattr(curr, field_name)
         previous_field_value = None
 
-        if prev and (
-            field_name in prev.model_fields
-        ):  # Check if field exists in prev model's definition
+        # Check if field exists in prev model's definition
+        if field_name in prev_fields:
             previous_field_value = getattr(prev, field_name)
 
         delta_value = _compute_delta_recursive(
@@ -5,6 +5,10 @@ import json
 from delta_stream._parser_state import ParserState
 
 
+# Maps each opening bracket on the parenthesis stack to its closing counterpart.
+_CLOSING_BRACKETS = str.maketrans("{[", "}]")
+
+
 def _finish_json(state: ParserState) -> str | None:
     """
     Attempts to construct a syntactically complete JSON string based on the parser state.
@@ -59,14 +63,11 @@ def _finish_json(state: ParserState) -> str | None:
 
     # Rule 3 (Revised): Check if parsing an incomplete literal/number
     if state.parsing_literal_or_number:
-        start_index = -1
         temp_agg_string = state.aggregated_json_string
 
-        for i in range(len(temp_agg_string) - 1, -1, -1):
-            char = temp_agg_string[i]
-            if char in ":[,{":  # Delimiters that precede a value
-                start_index = i + 1
-                break
+        # The value starts right after the last delimiter that can precede it
+        # (or at the beginning for a root-level literal).
+        start_index = max(temp_agg_string.rfind(delimiter) for delimiter in ":[,{") + 1
 
         partial_value_str = temp_agg_string[start_index:].strip()
 
@@ -95,11 +96,7 @@ def _finish_json(state: ParserState) -> str | None:
         suffix += '"'
 
     # Rule 5: Close open parentheses/brackets based on the stack
-    for bracket_type in reversed(state.parenthesis_stack):
-        if bracket_type == "{":
-            suffix += "}"
-        elif bracket_type == "[":
-            suffix += "]"
+    suffix += "".join(reversed(state.parenthesis_stack)).translate(_CLOSING_BRACKETS)
 
     # Clean potential trailing comma *before* adding suffix
     cleaned_candidate = candidate_string.rstrip()
@@ -7,6 +7,8 @@ compatible with streaming requirements.
 
 from __future__ import annotations
 
+from weakref import WeakKeyDictionary
+
 from pydantic import BaseModel
 
 from delta_stream._defaults import process_schema_with_defaults
@@ -15,6 +17,14 @@ from delta_stream._model_builder import create_model_with_defaults
 from delta_stream._schema import build_path_mapping
 
 
+# Streaming models already generated, keyed by the original model class. Model
+# classes are not mutated once defined, so entries never need invalidation, and
+# weak keys let locally defined models be garbage collected.
+_streaming_model_cache: WeakKeyDictionary[type[BaseModel], type[BaseModel]] = (
+    WeakKeyDictionary()
+)
+
+
 def _generate_model_with_defaults(model_class: type[BaseModel]) -> type[BaseModel]:
     """
     Generate a Pydantic model for streaming by setting appropriate defaults.
@@ -32,6 +42,9 @@ def _generate_model_with_defaults(model_class: type[BaseModel]) -> type[BaseMode
     7. Raise `DeltaStreamModelBuildError` for any other required field without a
        default specified via the above rules (e.g., required `int`, `float`, `bool`).
 
+    The generated model is cached per input class, so repeated calls (e.g. one
+    per `JsonStreamParser` instance) only build it once.
+
     Args:
         model_class: The Pydantic BaseModel class to process.
 
@@ -44,6 +57,10 @@ def _generate_model_with_defaults(model_class: type[BaseModel]) -> type[BaseMode
                                    field cannot be assigned a default value.
         TypeError: If input is not a Pydantic BaseModel class.
     """
+    cached_model = _streaming_model_cache.get(model_class)
+    if cached_model is not None:
+        return cached_model
+
     try:
         schema = model_class.model_json_schema()
 
@@ -61,9 +78,11 @@ def _generate_model_with_defaults(model_class: type[BaseModel]) -> type[BaseMode
             model_class, schema_with_defaults
         )
 
-        return model_with_defaults
-
     except Exception as e:
         raise DeltaStreamModelBuildError(
             f"Failed to prepare model {model_class.__name__} for streaming: {e}"
         ) from e
+
+    _streaming_model_cache[model_class] = model_with_defaults
+
+    return model_with_defaults
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 import json
+import re
 
 from typing import Generic
 from typing import TypeVar
@@ -19,6 +20,104 @@ from delta_stream._parser_state import ParserState
 
 T = TypeVar("T")
 
+# Matches a run of literal/number characters up to the next terminator.
+_LITERAL_RUN = re.compile(r"[^,}\]\s]*")
+# Matches a run of string content up to the next unescaped quote. Escape
+# sequences are consumed as pairs, so a trailing lone backslash is left over.
+_STRING_RUN = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+# Matches insignificant whitespace between tokens.
+_WHITESPACE_RUN = re.compile(r"\s*")
+
+
+def _handle_quote(state: ParserState, char: str) -> None:
+    """Enters a key or value string."""
+    state.is_inside_string = True
+    if state.expecting_key:
+        state.inside_key_string = True
+        state.expecting_key = False
+    else:
+        state.inside_key_string = False
+
+
+def _handle_open_brace(state: ParserState, char: str) -> None:
+    state.parenthesis_stack.append("{")
+    state.expecting_key = True
+
+
+def _handle_open_bracket(state: ParserState, char: str) -> None:
+    state.parenthesis_stack.append("[")
+    state.expecting_key = False
+
+
+def _handle_close_brace(state: ParserState, char: str) -> None:
+    if not state.parenthesis_stack or state.parenthesis_stack.pop() != "{":
+        raise DeltaStreamValidationError("Unexpected '}' or mismatched braces.")
+    state.expecting_key = False
+
+
+def _handle_close_bracket(state: ParserState, char: str) -> None:
+    if not state.parenthesis_stack or state.parenthesis_stack.pop() != "[":
+        raise DeltaStreamValidationError("Unexpected ']' or mismatched brackets.")
+    state.expecting_key = False
+
+
+def _handle_colon(state: ParserState, char: str) -> None:
+    state.expecting_key = False
+    state.just_saw_colon = True
+    state.recently_finished_key = False
+
+
+def _handle_comma(state: ParserState, char: str) -> None:
+    if not state.parenthesis_stack:
+        raise DeltaStreamValidationError("Unexpected ',' outside of array or object.")
+    # In objects, a comma signals that a new key is expected;
+    # in arrays, it simply separates values.
+    state.expecting_key = state.parenthesis_stack[-1] == "{"
+
+
+def _handle_value_start(state: ParserState, char: str) -> None:
+    """Starts a literal/number inside an array or at the root level."""
+    if not state.expecting_key and (
+        not state.parenthesis_stack or state.parenthesis_stack[-1] == "["
+    ):
+        if char in "tfn" or char.isdigit() or char == "-":
+            state.parsing_literal_or_number = True
+        else:
+            raise DeltaStreamValidationError(
+                f"Unexpected character '{char}' as start of value."
+            )
+
+    else:
+        raise DeltaStreamValidationError(
+            f"Unexpected character '{char}' in JSON structure. State: {state}"
+        )
+
+
+def _append_consumed(state: ParserState, consumed: list[str], last_char: str) -> None:
+    """Appends text consumed by `_parse_chunk` to the aggregated string."""
+    # Detach the string from the state before appending so that it is only
+    # referenced locally and CPython can grow it in place, instead of copying
+    # the whole document on every chunk.
+    aggregated = state.aggregated_json_string
+    state.aggregated_json_string = ""
+    aggregated += "".join(consumed)
+    state.aggregated_json_string = aggregated
+    state.last_char = last_char
+
+
+# Handlers for structural characters outside strings and literals; any other
+# non-whitespace character starts a literal after a colon, or otherwise goes to
+# `_handle_value_start`.
+_STRUCTURAL_HANDLERS = {
+    '"': _handle_quote,
+    "{": _handle_open_brace,
+    "[": _handle_open_bracket,
+    "}": _handle_close_brace,
+    "]": _handle_close_bracket,
+    ":": _handle_colon,
+    ",": _handle_comma,
+}
+
 
 class JsonStreamParser(Generic[T]):
     """
@@ -102,6 +201,16 @@ class JsonStreamParser(Generic[T]):
         self._previous_result: BaseModel | None = None
         self._state: ParserState = ParserState(parenthesis_stack=[])
 
+    def reset(self) -> None:
+        """
+        Clears the stream state so the parser can be reused for a new stream.
+
+        The generated streaming model is kept, so resetting is much cheaper than
+        creating a new parser for the same model.
+        """
+        self._previous_result = None
+        self._state = ParserState(parenthesis_stack=[])
+
     def parse_chunk(self, chunk: str) -> T | None:
         """
         Processes an incoming chunk of the JSON string stream and updates the internal state.
@@ -130,16 +239,15 @@ class JsonStreamParser(Generic[T]):
         if not isinstance(chunk, str):
             raise TypeError("chunk must be a string.")
 
-        if not self._state.aggregated_json_string and not self._state.parenthesis_stack:
+        state = self._state
+        if not state.aggregated_json_string and not state.parenthesis_stack:
             chunk = chunk.lstrip()
             if not chunk:  # Ignore pure whitespace if nothing has been aggregated
                 return None
 
-        #  Process characters one by one, updating state
-        for char in chunk:
-            self._parse_chunk_char(char)
+        self._parse_chunk(chunk)
 
-        candidate_string = _finish_json(state=self._state)
+        candidate_string = _finish_json(state=state)
 
         if candidate_string is None:
             return None
@@ -153,16 +261,13 @@ class JsonStreamParser(Generic[T]):
             if self._ignore_validation_errors:
                 return None
 
-            raise DeltaStreamValidationError(
-                f"Validation error during final parsing: {e}"
-            ) from e
-        except json.JSONDecodeError as e:
-
-            if self._ignore_validation_errors:
-                return None
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                raise DeltaStreamValidationError(
+                    f"JSON parsing error during final parsing: {candidate_string}"
+                ) from e
 
             raise DeltaStreamValidationError(
-                f"JSON parsing error during final parsing: {candidate_string}"
+                f"Validation error during final parsing: {e}"
             ) from e
         except Exception as e:
             raise DeltaStreamValidationError(
@@ -178,145 +283,123 @@ class JsonStreamParser(Generic[T]):
 
         return self.parse_json(delta_result)
 
-    def _parse_chunk_char(self, char: str) -> None:
+    def _parse_chunk(self, chunk: str) -> None:
         """
-        Processes a single character from the input stream, updating the parser state accordingly.
+        Processes a chunk of the input stream, updating the parser state accordingly.
 
         The function supports:
         - Literal/number parsing with a mechanism to “replay” terminator characters.
         - String parsing with proper handling of escape sequences.
         - Structural characters (whitespace, quotes, colons, commas, braces, and brackets)
-            updating the parenthesis stack and key expectation flag.
+            updating the parenthesis stack and key expectation flag, dispatched to the
+            handlers in `_STRUCTURAL_HANDLERS`.
+
+        Runs of literal/number characters, of string content (up to the next
+        unescaped quote) and of whitespace between tokens are consumed in a single
+        step instead of character by character. The consumed text is collected
+        locally and written back to the state at the end of the chunk (or when an
+        error is raised), and before any handler that reports the state in its
+        error message. The resulting state and errors are therefore identical to
+        feeding the chunk one character at a time.
 
         Raises:
         DeltaStreamValidationError: On invalid character sequences or state.
         """
-        # Cache the last character (for use in determining escapes)
-        saw_colon = self._state.just_saw_colon
-
-        # --- 1. Handle literal/number parsing mode ---
-        if self._state.parsing_literal_or_number:
-            if char in ",}]" or char.isspace():
-                # Terminator encountered; finish literal parsing and fall through to re-process this char.
-                self._state.parsing_literal_or_number = False
-                # (Don't immediately return—drop through to structural processing.)
-            else:
-                # Still within the literal/number: consume the char and update state.
-                self._state.aggregated_json_string += char
-                self._state.last_char = char
-                return  # Nothing else to do
-
-        # --- 2. Handle string parsing mode ---
-        if self._state.is_inside_string:
-            if char == '"' and not self._is_escaped_quote():
-                self._state.is_inside_string = False
-                if self._state.inside_key_string:
-                    self._state.recently_finished_key = True
-                self._state.inside_key_string = False
-                self._state.just_saw_colon = False
-
-            self._state.aggregated_json_string += char
-            self._state.last_char = char
-            return
-
-        # --- 3. Structural processing (outside string and literal) ---
-        # If the current char is not whitespace, reset colon flag.
-        if not char.isspace():
-            self._state.just_saw_colon = False
-
-        # Process whitespace: simply accumulate and do nothing else.
-        if char.isspace():
-            self._state.aggregated_json_string += char
-            self._state.last_char = char
-            return
-
-        # Process structural punctuation and delimiters.
-        if char == '"':
-            # Entering a string
-            self._state.is_inside_string = True
-            if self._state.expecting_key:
-                self._state.inside_key_string = True
-                self._state.expecting_key = False
-            else:
-                self._state.inside_key_string = False
-
-        elif char == "{":
-            self._state.parenthesis_stack.append("{")
-            self._state.expecting_key = True
-
-        elif char == "[":
-            self._state.parenthesis_stack.append("[")
-            self._state.expecting_key = False
-
-        elif char == "}":
-            if (
-                not self._state.parenthesis_stack
-                or self._state.parenthesis_stack.pop() != "{"
-            ):
-                raise DeltaStreamValidationError("Unexpected '}' or mismatched braces.")
-            self._state.expecting_key = False
-
-        elif char == "]":
-            if (
-                not self._state.parenthesis_stack
-                or self._state.parenthesis_stack.pop() != "["
-            ):
-                raise DeltaStreamValidationError(
-                    "Unexpected ']' or mismatched brackets."
-                )
-            self._state.expecting_key = False
-
-        elif char == ":":
-            self._state.expecting_key = False
-            self._state.just_saw_colon = True
-            self._state.recently_finished_key = False
-        elif char == ",":
-            if not self._state.parenthesis_stack:
-                raise DeltaStreamValidationError(
-                    "Unexpected ',' outside of array or object."
-                )
-            # In objects, a comma signals that a new key is expected;
-            # in arrays, it simply separates values.
-            if self._state.parenthesis_stack[-1] == "{":
-                self._state.expecting_key = True
-            elif self._state.parenthesis_stack[-1] == "[":
-                self._state.expecting_key = False
-
-        # If a colon was seen, the next non-structural character starts a literal/number.
-        elif saw_colon:
-            if char in '"{[,:]}' or char.isspace():
-                raise DeltaStreamValidationError(
-                    f"Unexpected character '{char}' after colon."
-                )
-            # Start literal/number mode and reconsume this char.
-            self._state.parsing_literal_or_number = True
-            self._state.aggregated_json_string += char
-            self._state.last_char = char
-            return
-
-        # Check for literal/number start in array or at the root level.
-        elif not self._state.expecting_key and (
-            not self._state.parenthesis_stack
-            or self._state.parenthesis_stack[-1] == "["
-        ):
-            if char in "tfn" or char.isdigit() or char == "-":
-                self._state.parsing_literal_or_number = True
-                self._state.aggregated_json_string += char
-                self._state.last_char = char
-                return
-            else:
-                raise DeltaStreamValidationError(
-                    f"Unexpected character '{char}' as start of value."
-                )
+        state = self._state
+        consumed: list[str] = []
+        index = 0
+        chunk_len = len(chunk)
+
+        # A backslash carried over from the previous chunk escapes the first
+        # character of this one.
+        escape_pending = (
+            state.is_inside_string
+            and state.last_char == "\\"
+            and self._is_escaped_quote()
+        )
 
-        else:
-            raise DeltaStreamValidationError(
-                f"Unexpected character '{char}' in JSON structure. State: {self._state}"
-            )
+        try:
+            while index < chunk_len:
+                # --- 1. Handle literal/number parsing mode ---
+                if state.parsing_literal_or_number:
+                    end = _LITERAL_RUN.match(chunk, index).end()
+                    if end == index:
+                        # Terminator encountered; finish literal parsing and
+                        # re-process this char as structural.
+                        state.parsing_literal_or_number = False
+                        continue
+
+                # --- 2. Handle string parsing mode ---
+                elif state.is_inside_string:
+                    if escape_pending:
+                        escape_pending = False
+                        end = index + 1
+                    else:
+                        end = chunk.find('"', index)
+                        if end < 0:
+                            end = chunk_len
+                        # Without escapes the run simply ends at the next
+                        # quote; only fall back to the regex for escape pairs.
+                        if chunk.find("\\", index, end) >= 0:
+                            end = _STRING_RUN.match(chunk, index).end()
+                        # The run stops at the closing quote, or at a lone
+                        # backslash ending the chunk; both are consumed here.
+                        if end < chunk_len:
+                            if chunk[end] == '"':
+                                state.is_inside_string = False
+                                if state.inside_key_string:
+                                    state.recently_finished_key = True
+                                state.inside_key_string = False
+                                state.just_saw_colon = False
+                            end += 1
+
+                # --- 3. Structural processing (outside string and literal) ---
+                else:
+                    char = chunk[index]
+                    handler = _STRUCTURAL_HANDLERS.get(char)
+
+                    if handler is None and char.isspace():
+                        # Whitespace is simply accumulated and leaves the flags
+                        # untouched.
+                        end = _WHITESPACE_RUN.match(chunk, index).end()
+                    else:
+                        # Any non-whitespace character ends the wait for a value
+                        # after a colon; the colon handler sets the flag again.
+                        saw_colon = state.just_saw_colon
+                        state.just_saw_colon = False
+
+                        if handler is not None:
+                            handler(state, char)
+                        elif saw_colon:
+                            # The value following a colon starts here.
+                            state.parsing_literal_or_number = True
+                        else:
+                            # The error message of `_handle_value_start` shows
+                            # the state, so bring it up to date first.
+                            if consumed:
+                                _append_consumed(state, consumed, chunk[index - 1])
+                                consumed.clear()
+                            _handle_value_start(state, char)
+                        end = index + 1
+
+                consumed.append(chunk[index:end])
+                index = end
+
+        finally:
+            # --- Final step: Update aggregated output and last_char ---
+            if consumed:
+                _append_consumed(state, consumed, chunk[index - 1])
+
+    def _parse_chunk_char(self, char: str) -> None:
+        """
+        Processes a single character from the input stream, updating the parser state accordingly.
 
-        # --- Final step: Update aggregated output and last_char ---
-        self._state.aggregated_json_string += char
-        self._state.last_char = char
+        Equivalent to `_parse_chunk` with a one-character chunk.
+
+        Raises:
+        DeltaStreamValidationError: On invalid character sequences or state.
+        """
+        self._parse_chunk(char)
 
     def _is_escaped_quote(self) -> bool:
         """
@@ -327,10 +410,11 @@ class JsonStreamParser(Generic[T]):
         True if the quote is escaped (an odd number of backslashes precede it),
         False otherwise.
         """
+        aggregated = self._state.aggregated_json_string
         count = 0
         # Examine the aggregated string from the end backward.
-        idx = len(self._state.aggregated_json_string) - 1
-        while idx >= 0 and self._state.aggregated_json_string[idx] == "\\":
+        idx = len(aggregated) - 1
+        while idx >= 0 and aggregated[idx] == "\\":
             count += 1
             idx -= 1
 
@@ -351,24 +435,21 @@ class JsonStreamParser(Generic[T]):
             A validated instance of the target model `T`.
 
         Raises:
-            DeltaStreamValidationError: If JSON parsing or Pydantic validation fails.
+            ValidationError: If the input is not valid JSON (error type
+                ``json_invalid``) or fails Pydantic validation.
             TypeError: If the input document type is invalid.
         """
 
-        parsed_json = None
-
-        if isinstance(input_json, str):
-            parsed_json = json.loads(input_json)
-        elif isinstance(input_json, bytes):
-            parsed_json = json.loads(input_json.decode())
-        elif isinstance(input_json, dict):
-            parsed_json = json.loads(json.dumps(input_json))
-        else:
+        if isinstance(input_json, dict):
+            input_json = json.dumps(input_json)
+        elif not isinstance(input_json, (str, bytes)):
             raise TypeError("input_json must be a string, bytes or dict.")
 
         # Step 1: Validate against the model WITH defaults applied
-        # This fills in missing fields using the defaults from mutated_schema
-        stream_data = self.stream_data_model.model_validate(parsed_json)
+        # This fills in missing fields using the defaults from mutated_schema.
+        # pydantic-core parses the JSON itself, so malformed JSON surfaces as a
+        # ValidationError as well.
+        stream_data = self.stream_data_model.model_validate_json(input_json)
 
         # Step 2: Dump the data (with defaults applied) back to a Python DICT
         # Use mode='python' for raw Python types
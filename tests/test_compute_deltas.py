@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 from typing import Any
+from typing import NamedTuple
 
 import pytest
 
 from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
+from pydantic import computed_field
 
 from delta_stream._compute_deltas import compute_delta
 
@@ -30,129 +34,201 @@ class FlexibleModel(BaseModel):
     d: NestedModelForD | None = None
 
 
+class ExtraAllowModel(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    a: str | None = None
+
+
+class ExcludedFieldModel(BaseModel):
+    a: str | None = None
+    secret: str | None = Field(None, exclude=True)
+
+
+class ComputedFieldModel(BaseModel):
+    a: str | None = None
+
+    @computed_field
+    @property
+    def a_len(self) -> int:
+        return len(self.a or "")
+
+
+class DeltaCase(NamedTuple):
+    case_id: str
+    prev_data: dict[str, Any] | None
+    curr_data: dict[str, Any]
+    model_cls: type[BaseModel]
+    expected_delta: dict[str, Any]
+
+
 # --- Test Cases with Pydantic Models Specified ---
-# Each tuple is: (ID, prev_data_dict_or_None, curr_data_dict, ModelToUse, expected_delta_dict)
 delta_test_cases_with_models = [
     # ID                     Prev_Data             Curr_Data                 Model_Class     Expected_Delta
-    (
+    DeltaCase(
         "Dict_New_Simple",
         None,
         {"a": 1, "b": "xyz"},
         FlexibleModel,
         {"a": 1, "b": "xyz"},
     ),
-    ("Dict_New_Empty", {}, {"a": 1, "b": "xyz"}, FlexibleModel, {"a": 1, "b": "xyz"}),
-    ("Dict_Num_Same", {"a": 1}, {"a": 1}, FlexibleModel, {"a": 1}),
-    ("Dict_Num_Change", {"a": 1}, {"a": 2}, FlexibleModel, {"a": 2}),
-    ("Dict_Bool_Same", {"b": True}, {"b": True}, FlexibleModel, {"b": True}),
-    ("Dict_Bool_Change", {"b": True}, {"b": False}, FlexibleModel, {"b": False}),
-    ("Dict_None_Same", {"c": None}, {"c": None}, FlexibleModel, {"c": None}),
-    ("Dict_None_Set", {"c": 1}, {"c": None}, FlexibleModel, {"c": None}),
-    ("Dict_Str_Same", {"s": "abc"}, {"s": "abc"}, FlexibleModel, {"s": ""}),
-    ("Dict_Str_Append", {"s": "abc"}, {"s": "abcdef"}, FlexibleModel, {"s": "def"}),
-    ("Dict_Str_Diff", {"s": "xyz"}, {"s": "abc"}, FlexibleModel, {"s": "abc"}),
-    ("Dict_Str_New", {}, {"s": "abc"}, FlexibleModel, {"s": "abc"}),
-    ("Dict_Str_FromNone", {"s": None}, {"s": "abc"}, FlexibleModel, {"s": "abc"}),
+    DeltaCase(
+        "Dict_New_Empty", {}, {"a": 1, "b": "xyz"}, FlexibleModel, {"a": 1, "b": "xyz"}
+    ),
+    DeltaCase("Dict_Num_Same", {"a": 1}, {"a": 1}, FlexibleModel, {"a": 1}),
+    DeltaCase("Dict_Num_Change", {"a": 1}, {"a": 2}, FlexibleModel, {"a": 2}),
+    DeltaCase("Dict_Bool_Same", {"b": True}, {"b": True}, FlexibleModel, {"b": True}),
+    DeltaCase(
+        "Dict_Bool_Change", {"b": True}, {"b": False}, FlexibleModel, {"b": False}
+    ),
+    DeltaCase("Dict_None_Same", {"c": None}, {"c": None}, FlexibleModel, {"c": None}),
+    DeltaCase("Dict_None_Set", {"c": 1}, {"c": None}, FlexibleModel, {"c": None}),
+    DeltaCase("Dict_Str_Same", {"s": "abc"}, {"s": "abc"}, FlexibleModel, {"s": ""}),
+    DeltaCase(
+        "Dict_Str_Append", {"s": "abc"}, {"s": "abcdef"}, FlexibleModel, {"s": "def"}
+    ),
+    DeltaCase("Dict_Str_Diff", {"s": "xyz"}, {"s": "abc"}, FlexibleModel, {"s": "abc"}),
+    DeltaCase(
+        "Dict_Str_Diverge", {"s": "abd"}, {"s": "abc"}, FlexibleModel, {"s": "abc"}
+    ),
+    DeltaCase("Dict_Str_New", {}, {"s": "abc"}, FlexibleModel, {"s": "abc"}),
+    DeltaCase(
+        "Dict_Str_FromNone", {"s": None}, {"s": "abc"}, FlexibleModel, {"s": "abc"}
+    ),
     # This test's expectation relies on iterating over curr's explicitly set fields.
-    ("Dict_KeyRemoved", {"n": 1, "k": "v"}, {"k": "v"}, FlexibleModel, {"k": ""}),
-    (
+    DeltaCase(
+        "Dict_KeyRemoved", {"n": 1, "k": "v"}, {"k": "v"}, FlexibleModel, {"k": ""}
+    ),
+    DeltaCase(
         "Dict_KeyAddedStr",
         {"k": "v"},
         {"k": "v", "k2": "v2"},
         FlexibleModel,
         {"k": "", "k2": "v2"},
     ),
-    (
+    DeltaCase(
         "Dict_KeyAddedNum",
         {"k": "v"},
         {"k": "v", "k2": 123},
         FlexibleModel,
         {"k": "", "k2": 123},
     ),
-    ("Dict_List_New", {}, {"l": ["a"]}, FlexibleModel, {"l": ["a"]}),
-    (
+    DeltaCase("Dict_List_New", {}, {"l": ["a"]}, FlexibleModel, {"l": ["a"]}),
+    DeltaCase(
         "Dict_List_AddElemStr",
         {"l": ["a"]},
         {"l": ["a", "b"]},
         FlexibleModel,
         {"l": ["", "b"]},
     ),
-    ("Dict_List_AddElemNum", {"l": [1]}, {"l": [1, 2]}, FlexibleModel, {"l": [1, 2]}),
-    (
+    DeltaCase(
+        "Dict_List_AddElemNum", {"l": [1]}, {"l": [1, 2]}, FlexibleModel, {"l": [1, 2]}
+    ),
+    DeltaCase(
         "Dict_List_StrAppend",
         {"l": ["abc"]},
         {"l": ["abcdef"]},
         FlexibleModel,
         {"l": ["def"]},
     ),
-    (
+    DeltaCase(
         "Dict_List_MixedChange",
         {"l": ["abc", 1]},
         {"l": ["abcdef", 2]},
         FlexibleModel,
         {"l": ["def", 2]},
     ),
-    ("Dict_Nest_New", {}, {"d": {"a": 1}}, FlexibleModel, {"d": {"a": 1}}),
-    (
+    DeltaCase("Dict_Nest_New", {}, {"d": {"a": 1}}, FlexibleModel, {"d": {"a": 1}}),
+    DeltaCase(
         "Dict_Nest_ChangeNum",
         {"d": {"a": 1}},
         {"d": {"a": 2}},
         FlexibleModel,
         {"d": {"a": 2}},
     ),
-    (
+    DeltaCase(
         "Dict_Nest_ChangeStr",
         {"d": {"s": "a"}},
         {"d": {"s": "ab"}},
         FlexibleModel,
         {"d": {"s": "b"}},
     ),
-    (
+    DeltaCase(
         "Dict_Nest_AddKey",
         {"d": {"a": 1}},
         {"d": {"a": 1, "b": "x"}},
         FlexibleModel,
         {"d": {"a": 1, "b": "x"}},
     ),
-    (
+    DeltaCase(
         "Dict_Nest_ListChange",
         {"d": {"l": ["a"]}},
         {"d": {"l": ["a", "b"]}},
         FlexibleModel,
         {"d": {"l": ["", "b"]}},
     ),
-    ("Dict_TypeChange", {"k": 1}, {"k": "abc"}, FlexibleModel, {"k": "abc"}),
-    ("Dict_TypeChangeList", {"k": "abc"}, {"k": [1]}, FlexibleModel, {"k": [1]}),
+    DeltaCase("Dict_TypeChange", {"k": 1}, {"k": "abc"}, FlexibleModel, {"k": "abc"}),
+    DeltaCase(
+        "Dict_TypeChangeList", {"k": "abc"}, {"k": [1]}, FlexibleModel, {"k": [1]}
+    ),
+    DeltaCase(
+        "Extra_New",
+        None,
+        {"a": "x", "zz": "y"},
+        ExtraAllowModel,
+        {"a": "x", "zz": "y"},
+    ),
+    DeltaCase(
+        "Extra_Append",
+        {"a": "x", "zz": "y"},
+        {"a": "xy", "zz": "yz"},
+        ExtraAllowModel,
+        {"a": "y", "zz": "yz"},
+    ),
+    DeltaCase("Excluded_Only", None, {"secret": "s"}, ExcludedFieldModel, {}),
+    DeltaCase(
+        "Excluded_Append",
+        {"a": "x", "secret": "s"},
+        {"a": "xy", "secret": "st"},
+        ExcludedFieldModel,
+        {"a": "y"},
+    ),
+    DeltaCase("Computed_Unset", None, {}, ComputedFieldModel, {"a_len": 0}),
+    DeltaCase(
+        "Computed_Append",
+        {"a": "x"},
+        {"a": "xy"},
+        ComputedFieldModel,
+        {"a": "y", "a_len": 2},
+    ),
 ]
 # fmt: on
 
-delta_test_ids = [case[0] for case in delta_test_cases_with_models]
+# Models are validated once at import instead of on every test invocation;
+# compute_delta only reads them, so sharing the instances is safe.
+prebuilt_delta_test_cases = [
+    pytest.param(
+        case.model_cls(**case.prev_data) if case.prev_data is not None else None,
+        case.model_cls(**case.curr_data),
+        case.expected_delta,
+        id=case.case_id,
+    )
+    for case in delta_test_cases_with_models
+]
 
 
 @pytest.mark.parametrize(
-    "test_id, prev_data, curr_data, model_cls, expected_delta",
-    [
-        (c[0], c[1], c[2], c[3], c[4]) for c in delta_test_cases_with_models
-    ],  # Ensure correct indexing
-    ids=delta_test_ids,
+    "prev_model, curr_model, expected_delta", prebuilt_delta_test_cases
 )
 def test_compute_delta_with_models(
-    test_id: str,
-    prev_data: dict | None,
-    curr_data: dict,
-    model_cls: type[BaseModel],
+    prev_model: BaseModel | None,
+    curr_model: BaseModel,
     expected_delta: dict,
 ):
     """
     Tests the compute_delta function using Pydantic models instantiated from dictionary data.
-    """
-    prev_model: BaseModel | None = None
-    if prev_data is not None:
-        # If prev_data is an empty dict {}, this creates a model with default values.
-        prev_model = model_cls(**prev_data)
-
-    # curr_data is never None in the test cases
-    curr_model: BaseModel = model_cls(**curr_data)
 
+    A prev_data of {} yields a model with default values, and None means no previous model.
+    """
     actual_delta = compute_delta(prev_model, curr_model)
     assert actual_delta == expected_delta
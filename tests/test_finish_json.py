@@ -13,6 +13,11 @@ from delta_stream.stream_parser import JsonStreamParser
 
 BACK_SLASH = chr(92)  # This is the backslash character in Python
 
+
+class DummyModel(BaseModel):
+    pass
+
+
 test_cases = [
     # Rule 1: Inside Key String -> None
     ('{"k', None),  # Incomplete key at root
@@ -82,20 +87,21 @@ test_cases = [
 # Parameterize the test function
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """A single parser shared by all cases; each test resets its state."""
+    return JsonStreamParser(DummyModel)
+
+
 @pytest.mark.parametrize("input_snippet, expected_output", test_cases)
-def test_finish_json_logic(input_snippet, expected_output):
+def test_finish_json_logic(parser, input_snippet, expected_output):
     """
     Tests the _finish_json function by simulating the state after parsing
     an input snippet and asserting the output matches the expected completion.
     """
-
-    class DummyModel(BaseModel):
-        pass
-
-    parser = JsonStreamParser(DummyModel)
+    parser.reset()
     try:
-        for char in input_snippet:
-            parser._parse_chunk_char(char)
+        parser._parse_chunk(input_snippet)
     except DeltaStreamValidationError as e:
         pytest.fail(
             f"Preprocessing snippet '{input_snippet}' failed with validation error: {e}"
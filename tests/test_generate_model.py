@@ -279,3 +279,28 @@ def test_generate_union_syntax_defaults_and_errors():
         instance.stream_float_bool == 1.2
     ), "stream_float_bool failed (default=1.2 should win)"
     assert instance.def_list_str == "", "def_list_str failed (factory should win)"
+
+
+def test_generate_model_is_cached_per_class():
+    """
+    Tests that the streaming model is built once per input class and reused,
+    while failed builds are not cached.
+    """
+
+    class CachedInput(BaseModel):
+        s: str
+
+    class OtherInput(BaseModel):
+        s: str
+
+    generated_model = _generate_model_with_defaults(CachedInput)
+
+    assert _generate_model_with_defaults(CachedInput) is generated_model
+    assert _generate_model_with_defaults(OtherInput) is not generated_model
+
+    class MissingInt(BaseModel):
+        a: int
+
+    for _ in range(2):
+        with pytest.raises(DeltaStreamModelBuildError):
+            _generate_model_with_defaults(MissingInt)
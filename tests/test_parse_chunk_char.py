@@ -9,6 +9,28 @@ from delta_stream._parser_state import ParserState
 from delta_stream.stream_parser import JsonStreamParser
 
 
+class DummyModel(BaseModel):
+    pass
+
+
+def _build_expected_states(source, states_tuples):
+    """Builds the expected ParserState after each character of `source`."""
+    return [
+        ParserState(
+            is_inside_string=expected_tuple[0],
+            expecting_key=expected_tuple[1],
+            inside_key_string=expected_tuple[2],
+            parsing_literal_or_number=expected_tuple[3],
+            parenthesis_stack=expected_tuple[4],
+            just_saw_colon=expected_tuple[5],
+            recently_finished_key=expected_tuple[6],
+            last_char=expected_tuple[7],
+            aggregated_json_string=source[: i + 1],
+        )
+        for i, expected_tuple in enumerate(states_tuples)
+    ]
+
+
 json_string = '{"s":"abc","n":null,"b":true,"i":123,"a_s":["xyz"],"a_o":[{"k":1},{"l":2}],"o":{"n":{"m":false}}}'
 
 # Define the expected state *after* processing the character at the given index
@@ -212,6 +234,8 @@ expected_states_tuples = [
     (False, False, False, False, [], False, False, "}"),
 ]
 
+expected_states = _build_expected_states(json_string, expected_states_tuples)
+
 
 def test_parse_delta_char_state_transitions():
     """
@@ -219,9 +243,6 @@ def test_parse_delta_char_state_transitions():
     JSON string character by character and asserting the expected state after each char.
     """
 
-    class DummyModel(BaseModel):
-        pass
-
     parser = JsonStreamParser(DummyModel)  # Use dummy model
 
     assert len(json_string) == len(
@@ -229,20 +250,7 @@ def test_parse_delta_char_state_transitions():
     ), f"Mismatch between JSON string length ({len(json_string)}) and expected states ({len(expected_states_tuples)})"
 
     for i, char in enumerate(json_string):
-        # Construct the expected state for this step
-        expected_tuple = expected_states_tuples[i]
-        expected_state = ParserState(
-            is_inside_string=expected_tuple[0],
-            expecting_key=expected_tuple[1],
-            inside_key_string=expected_tuple[2],
-            parsing_literal_or_number=expected_tuple[3],
-            parenthesis_stack=list(expected_tuple[4]),  # Ensure list copy
-            just_saw_colon=expected_tuple[5],
-            # NEW: index 6 for recently_finished_key
-            recently_finished_key=expected_tuple[6],
-            last_char=expected_tuple[7],  # index 7 for last_char
-            aggregated_json_string=json_string[: i + 1],
-        )
+        expected_state = expected_states[i]
         try:
             parser._parse_chunk_char(char)
             current_state = parser._state
@@ -416,6 +424,10 @@ whitespace_expected_states_tuples = [
     (False, False, False, False, [], False, False, "\n"),
 ]
 
+whitespace_expected_states = _build_expected_states(
+    whitespace_json_string, whitespace_expected_states_tuples
+)
+
 
 def test_parse_delta_char_with_whitespace():
     """
@@ -423,9 +435,6 @@ def test_parse_delta_char_with_whitespace():
     containing significant whitespace between tokens.
     """
 
-    class DummyModel(BaseModel):
-        pass
-
     parser = JsonStreamParser(DummyModel)  # Use dummy model
 
     assert len(whitespace_json_string) == len(
@@ -433,19 +442,7 @@ def test_parse_delta_char_with_whitespace():
     ), f"Mismatch between whitespace JSON string length ({len(whitespace_json_string)}) and expected states ({len(whitespace_expected_states_tuples)})"
 
     for i, char in enumerate(whitespace_json_string):
-        # Construct the expected state for this step
-        expected_tuple = whitespace_expected_states_tuples[i]
-        expected_state = ParserState(
-            is_inside_string=expected_tuple[0],
-            expecting_key=expected_tuple[1],
-            inside_key_string=expected_tuple[2],
-            parsing_literal_or_number=expected_tuple[3],
-            parenthesis_stack=list(expected_tuple[4]),
-            just_saw_colon=expected_tuple[5],
-            recently_finished_key=expected_tuple[6],
-            last_char=expected_tuple[7],
-            aggregated_json_string=whitespace_json_string[: i + 1],
-        )
+        expected_state = whitespace_expected_states[i]
 
         try:
             parser._parse_chunk_char(char)
@@ -476,3 +473,72 @@ def test_parse_delta_char_with_whitespace():
     assert (
         parser._state.aggregated_json_string == whitespace_json_string
     ), "Final aggregated string doesn't match input"
+
+
+@pytest.mark.parametrize(
+    "input_string",
+    [
+        json_string,
+        whitespace_json_string,
+        '{"mix": "A\\\\\\"B\\\\tC\\\\\\\\D", "arr": ["x\\"y", "\\\\"], "e": "\\u00e9"}',
+    ],
+    ids=["compact", "whitespace", "escapes"],
+)
+def test_parse_chunk_matches_char_by_char(input_string):
+    """
+    Tests that feeding a whole chunk through _parse_chunk yields the same state
+    as feeding it one character at a time through _parse_chunk_char.
+    """
+
+    char_parser = JsonStreamParser(DummyModel)
+    for char in input_string:
+        char_parser._parse_chunk_char(char)
+
+    chunk_parser = JsonStreamParser(DummyModel)
+    for split in range(len(input_string) + 1):
+        chunk_parser.reset()
+        chunk_parser._parse_chunk(input_string[:split])
+        chunk_parser._parse_chunk(input_string[split:])
+
+        assert chunk_parser._state == char_parser._state, f"Mismatch at split {split}"
+
+
+@pytest.mark.parametrize("input_string", [":}", '{"a":]', "[1,2]:,"])
+def test_failed_structural_char_clears_colon_flag(input_string):
+    """
+    Tests that a structural character rejected right after a colon still clears
+    the colon flag, as it does when the character is accepted.
+    """
+
+    parser = JsonStreamParser(DummyModel)
+
+    with pytest.raises(DeltaStreamValidationError):
+        for char in input_string:
+            parser._parse_chunk_char(char)
+
+    assert parser._state.just_saw_colon is False
+
+
+def test_parse_chunk_error_mid_chunk_reports_preceding_state():
+    """
+    Tests that an error partway through a multi-character chunk reports, and
+    leaves behind, the state after the characters preceding the offending one.
+    """
+
+    parser = JsonStreamParser(DummyModel)
+    parser.parse_chunk('{"a": 1')
+
+    expected_state = ParserState(
+        parenthesis_stack=["{"],
+        expecting_key=True,
+        last_char=" ",
+        aggregated_json_string='{"a": 1, ',
+    )
+
+    with pytest.raises(DeltaStreamValidationError) as exc_info:
+        parser.parse_chunk(", x}")
+
+    assert str(exc_info.value) == (
+        f"Unexpected character 'x' in JSON structure. State: {expected_state}"
+    )
+    assert parser._state == expected_state
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import json
+
 from typing import Any
+from typing import ClassVar
 
 import pytest
 
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import ValidationError
 
 from delta_stream._errors import DeltaStreamValidationError
 from delta_stream.stream_parser import JsonStreamParser
@@ -39,39 +43,65 @@ class Warehouse(BaseModel):
     inventory: list[InventoryItem]
 
 
-def chunk_string(data: str, size: int):
-    for i in range(0, len(data), size):
-        yield data[i : i + size]
+class Article(BaseModel):
+    title: str
+
+
+def chunk_string(data: str, size: int) -> list[str]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.fixture(scope="class")
+def user_case():
+    """A complete User and its JSON, serialized once for all chunk sizes."""
+    original_user = User(
+        id=101,
+        username="dave",
+        aliases=["david", "d"],
+        address=Address(street="123 Main St", city="Anytown", zip=12345),
+        roles=["ADMIN", "2USER"],
+    )
+    return original_user, original_user.model_dump_json()
+
+
+@pytest.fixture(scope="class")
+def warehouse_case():
+    """A complete Warehouse and its JSON, serialized once for all chunk sizes."""
+    original_warehouse = Warehouse(
+        warehouse_id="WH-NORTH",
+        location=Address(street="456 Side St", zip=54321, city=None),
+        inventory=[
+            InventoryItem(
+                sku="SKU001", name="Thingamajig", count=10, tags=["red", "new"]
+            ),
+            InventoryItem(sku="SKU002", name="Widget", count=5, tags=[]),
+            InventoryItem(sku="SKU003", name="XD", count=0, tags=[]),
+        ],
+    )
+    return original_warehouse, original_warehouse.model_dump_json()
 
 
 class TestJsonStreamParserEndToEnd:
+    USER_CHUNK_SIZES = (1, 2, 3, 5, 8, 10, 20)
+    WAREHOUSE_CHUNK_SIZES = (1, 2, 3, 5, 8, 10, 25)
 
-    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 10, 20])
-    def test_user_stream_no_delta(self, chunk_size):
+    @pytest.mark.parametrize("chunk_size", USER_CHUNK_SIZES)
+    def test_user_stream_no_delta(self, user_case, chunk_size):
         """
         Tests streaming User model with delta_mode=False.
         Verifies the last non-None result matches the original complete object.
         """
 
-        original_user = User(
-            id=101,
-            username="dave",
-            aliases=["david", "d"],
-            address=Address(street="123 Main St", city="Anytown", zip=12345),
-            roles=["ADMIN", "USER"],
-        )
-
-        json_input = original_user.model_dump_json()
+        _, json_input = user_case
 
         parser = JsonStreamParser(User, delta_mode=False)
-        results = []
+        last_result = None
 
         for chunk in chunk_string(json_input, chunk_size):
             try:
                 result = parser.parse_chunk(chunk)
                 if result is not None:
-                    assert isinstance(result, User)
-                    results.append(result)
+                    last_result = result
             except DeltaStreamValidationError as e:
                 pytest.fail(
                     f"Validation error (size={chunk_size}): {e}\nInput: '{json_input}'\nChunk: '{chunk}'\nState: {parser._state}"
@@ -82,41 +112,30 @@ class TestJsonStreamParserEndToEnd:
                 )
 
         assert (
-            results
+            last_result is not None
         ), f"Parser did not return any valid results for chunk size {chunk_size}"
+        assert isinstance(last_result, User)
         assert (
-            results[-1] == original_user
+            last_result.model_dump_json() == json_input
         ), f"Final result mismatch for chunk size {chunk_size}"
 
-    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 10, 25])
-    def test_warehouse_stream_no_delta(self, chunk_size):
+    @pytest.mark.parametrize("chunk_size", WAREHOUSE_CHUNK_SIZES)
+    def test_warehouse_stream_no_delta(self, warehouse_case, chunk_size):
         """
         Tests streaming Warehouse model (list of objects) with delta_mode=False.
         Verifies the last non-None result matches the original complete object.
         """
 
-        original_warehouse = Warehouse(
-            warehouse_id="WH-NORTH",
-            location=Address(street="456 Side St", zip=54321, city=None),
-            inventory=[
-                InventoryItem(
-                    sku="SKU001", name="Thingamajig", count=10, tags=["red", "new"]
-                ),
-                InventoryItem(sku="SKU002", name="Widget", count=5, tags=[]),
-                InventoryItem(sku="SKU003", name="XD", count=0, tags=[]),
-            ],
-        )
-        json_input = original_warehouse.model_dump_json()
+        _, json_input = warehouse_case
 
         parser = JsonStreamParser(Warehouse, delta_mode=False)
-        results = []
+        last_result = None
 
         for chunk in chunk_string(json_input, chunk_size):
             try:
                 result = parser.parse_chunk(chunk)
                 if result is not None:
-                    assert isinstance(result, Warehouse)
-                    results.append(result)
+                    last_result = result
             except DeltaStreamValidationError as e:
                 pytest.fail(
                     f"Validation error (size={chunk_size}): {e}\nInput: '{json_input}'\nChunk: '{chunk}'\nState: {parser._state}"
@@ -127,103 +146,106 @@ class TestJsonStreamParserEndToEnd:
                 )
 
         assert (
-            results
+            last_result is not None
         ), f"Parser did not return any valid results for chunk size {chunk_size}"
+        assert isinstance(last_result, Warehouse)
         assert (
-            results[-1] == original_warehouse
+            last_result.model_dump_json() == json_input
         ), f"Final result mismatch for chunk size {chunk_size}"
-        assert results[-1].inventory[1].tags == []
-        assert results[-1].location.city is None  # Verify None default
+        assert last_result.inventory[1].tags == []
+        assert last_result.location.city is None  # Verify None default
 
     def apply_delta(self, base: dict | None, delta: dict) -> dict:
         """
         Applies a delta dictionary to a base dictionary to reconstruct the full state.
 
+        The base is updated in place, so keys not affected by the delta are kept
+        without being copied.
+
         Args:
             base: The previous state dictionary, or None if starting from scratch.
             delta: The delta dictionary representing changes or new additions.
 
         Returns:
-            A new dictionary representing the reconstructed full state.
+            The updated base dictionary (a new one if base was None).
         """
-        base_dict = base.copy() if isinstance(base, dict) else {}
-        result = {}
+        base_dict = base if type(base) is dict else {}
 
         for key, delta_value in delta.items():
-            base_value = base_dict.get(key)
+            base_dict[key] = self._apply_delta_recursive(
+                base_dict.get(key), delta_value
+            )
+
+        return base_dict
+
+    def _apply_str_delta(self, base_value: Any, delta_value: str) -> str:
+        """Appends to a string base, otherwise replaces it."""
+        if type(base_value) is str:
+            return base_value + delta_value
+        return delta_value
+
+    def _apply_list_delta(self, base_value: Any, delta_value: list) -> list:
+        """Applies list deltas element-wise, updating the base list in place."""
+        base_list = base_value if type(base_value) is list else []
 
-            result[key] = self._apply_delta_recursive(base_value, delta_value)
+        # A list delta always spans the whole current list.
+        del base_list[len(delta_value) :]
+        base_len = len(base_list)
 
-        # Preserve keys from base that were not affected by delta
-        for key, value in base_dict.items():
-            if key not in result:
-                result[key] = value
+        for i, delta_item in enumerate(delta_value):
+            if i < base_len:
+                base_list[i] = self._apply_delta_recursive(base_list[i], delta_item)
+            else:
+                base_list.append(self._apply_delta_recursive(None, delta_item))
 
-        return result
+        return base_list
+
+    def _apply_dict_delta(self, base_value: Any, delta_value: dict) -> dict:
+        return self.apply_delta(base_value, delta_value)
+
+    # Deltas come from model_dump(), so their exact type selects the handler.
+    _delta_handlers: ClassVar[dict[type, Any]] = {
+        str: _apply_str_delta,
+        list: _apply_list_delta,
+        dict: _apply_dict_delta,
+    }
 
     def _apply_delta_recursive(self, base_value: Any, delta_value: Any) -> Any:
         """
         Recursive helper to apply delta values to base values.
         """
-        # Delta is None, result is None
-        if delta_value is None:
-            return None
+        handler = self._delta_handlers.get(type(delta_value))
 
-        # If delta is a string and base is a string -> append
-        if isinstance(delta_value, str) and isinstance(base_value, str):
-            return base_value + delta_value
-
-        # If delta is a string and base is not a string or None -> replace
-        if isinstance(delta_value, str):
+        # None and other scalars replace the base value
+        if handler is None:
             return delta_value
 
-        # If delta is a list, apply recursively element-wise
-        if isinstance(delta_value, list):
-            base_list = base_value if isinstance(base_value, list) else []
-            result_list = []
-            for i, delta_item in enumerate(delta_value):
-                base_item = base_list[i] if i < len(base_list) else None
-                result_list.append(self._apply_delta_recursive(base_item, delta_item))
-            return result_list
-
-        if isinstance(delta_value, dict):
-            base_dict = base_value if isinstance(base_value, dict) else {}
-            return self.apply_delta(base_dict, delta_value)
+        return handler(self, base_value, delta_value)
 
-        return delta_value
-
-    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 10, 20])
-    def test_user_stream_delta_mode(self, chunk_size):
+    def _run_delta_stream(
+        self,
+        model_cls: type[BaseModel],
+        original_obj: BaseModel,
+        json_input: str,
+        chunk_size: int,
+    ) -> None:
         """
-        Tests streaming User model with delta_mode=True.
-        Verifies that applying the sequence of deltas reconstructs the original object.
+        Streams `json_input` in delta mode and checks that applying the sequence
+        of deltas reconstructs `original_obj`.
         """
-        original_user = User(
-            id=101,
-            username="dave",
-            aliases=["david", "d"],
-            address=Address(street="123 Main St", city="Anytown", zip=12345),
-            roles=["ADMIN", "2USER"],
-        )
-        json_input = original_user.model_dump_json()
-
-        parser = JsonStreamParser(User, delta_mode=True)
+        parser = JsonStreamParser(model_cls, delta_mode=True)
 
         reconstructed_dict: dict | None = None
         processed_len = 0
-        result_delta_objects = []
         for chunk in chunk_string(json_input, chunk_size):
             processed_len += len(chunk)
             try:
-                # This is a User instance representing delta
+                # This is a model instance representing the delta
                 result_delta_obj = parser.parse_chunk(chunk)
 
-                result_delta_objects.append(result_delta_obj)
-
                 if result_delta_obj is not None:
                     # Apply the delta to the reconstructed dictionary
-
-                    assert isinstance(result_delta_obj, User)
+                    assert isinstance(result_delta_obj, model_cls)
                     delta_dict = result_delta_obj.model_dump()
                     reconstructed_dict = self.apply_delta(
                         reconstructed_dict, delta_dict
@@ -249,61 +271,119 @@ class TestJsonStreamParserEndToEnd:
         )
 
         assert (
-            final_reconstructed_object == original_user
+            final_reconstructed_object == original_obj
         ), f"Reconstructed object mismatch for chunk size {chunk_size}"
 
-    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 10, 25])
-    def test_warehouse_stream_delta_mode(self, chunk_size):
+    @pytest.mark.parametrize("chunk_size", USER_CHUNK_SIZES)
+    def test_user_stream_delta_mode(self, user_case, chunk_size):
+        """
+        Tests streaming User model with delta_mode=True.
+        Verifies that applying the sequence of deltas reconstructs the original object.
+        """
+        original_user, json_input = user_case
+
+        self._run_delta_stream(User, original_user, json_input, chunk_size)
+
+    @pytest.mark.parametrize("chunk_size", WAREHOUSE_CHUNK_SIZES)
+    def test_warehouse_stream_delta_mode(self, warehouse_case, chunk_size):
         """
         Tests streaming Warehouse model with delta_mode=True.
         Verifies that applying the sequence of deltas reconstructs the original object.
         """
-        original_warehouse = Warehouse(
-            warehouse_id="WH-NORTH",
-            location=Address(street="456 Side St", zip=54321, city=None),
-            inventory=[
-                InventoryItem(
-                    sku="SKU001", name="Thingamajig", count=10, tags=["red", "new"]
-                ),
-                InventoryItem(sku="SKU002", name="Widget", count=5, tags=[]),
-                InventoryItem(sku="SKU003", name="XD", count=0, tags=[]),
-            ],
+        original_warehouse, json_input = warehouse_case
+
+        self._run_delta_stream(Warehouse, original_warehouse, json_input, chunk_size)
+
+    def test_reset_reuses_parser_for_new_stream(self):
+        """
+        Tests that reset() clears the stream state (including the previous delta
+        result) while keeping the generated streaming model.
+        """
+        original_user = User(
+            id=7,
+            username="eve",
+            aliases=[],
+            address=Address(street="1 Loop Rd", city=None, zip=10001),
+            roles=None,
         )
-        json_input = original_warehouse.model_dump_json()
+        json_input = original_user.model_dump_json()
 
-        parser = JsonStreamParser(Warehouse, delta_mode=True)
+        parser = JsonStreamParser(User, delta_mode=True)
+        stream_data_model = parser.stream_data_model
 
-        reconstructed_dict: dict | None = None
-        processed_len = 0
-        for chunk in chunk_string(json_input, chunk_size):
-            processed_len += len(chunk)
-            try:
-                result_delta_obj = parser.parse_chunk(chunk)
-                if result_delta_obj is not None:
-                    assert isinstance(result_delta_obj, Warehouse)
-                    delta_dict = result_delta_obj.model_dump()
-                    reconstructed_dict = self.apply_delta(
-                        reconstructed_dict, delta_dict
-                    )
-                    # print(f"DEBUG @ {processed_len}: Delta: {delta_dict}") # Debug
-                    # print(f"DEBUG @ {processed_len}: Reconstructed: {reconstructed_dict}") # Debug
-            except DeltaStreamValidationError as e:
-                pytest.fail(
-                    f"Validation error (size={chunk_size}) at ~char {processed_len}: {e}\nInput: '{json_input}'\nChunk: '{chunk}'\nState: {parser._state}"
-                )
-            except Exception as e:
-                pytest.fail(
-                    f"Unexpected error (size={chunk_size}) at ~char {processed_len}: {type(e).__name__}: {e}\nInput: '{json_input}'\nChunk: '{chunk}'\nState: {parser._state}"
-                )
+        first_delta = parser.parse_chunk(json_input)
+        assert first_delta == original_user
 
-        assert (
-            reconstructed_dict is not None
-        ), f"Parser did not produce any usable delta results for chunk size {chunk_size}"
+        # A half-finished stream must not leak into the next one.
+        parser.parse_chunk('{"username": "trunc')
+        parser.reset()
 
-        final_reconstructed_object = parser.data_model.model_validate(
-            reconstructed_dict
-        )
+        assert parser.stream_data_model is stream_data_model
+        assert parser.parse_chunk(json_input) == original_user
 
-        assert (
-            final_reconstructed_object == original_warehouse
-        ), f"Reconstructed object mismatch for chunk size {chunk_size}"
+
+MALFORMED_ADDRESS_JSON = '{"street": "1 Loop Rd", "city": null, "zip": 1.2.3}'
+
+
+def test_malformed_json_is_ignored_by_default():
+    """
+    Tests that a structurally complete but malformed document yields None when
+    validation errors are ignored.
+    """
+    parser = JsonStreamParser(Address, ignore_validation_errors=True)
+
+    assert parser.parse_chunk(MALFORMED_ADDRESS_JSON) is None
+
+
+def test_malformed_json_raises_when_not_ignored():
+    """
+    Tests that a malformed document raises DeltaStreamValidationError, reporting
+    the candidate string, when validation errors are not ignored.
+    """
+    parser = JsonStreamParser(Address, ignore_validation_errors=False)
+
+    with pytest.raises(DeltaStreamValidationError) as exc_info:
+        parser.parse_chunk(MALFORMED_ADDRESS_JSON)
+
+    assert str(exc_info.value) == (
+        f"JSON parsing error during final parsing: {MALFORMED_ADDRESS_JSON}"
+    )
+
+
+def test_parse_json_rejects_malformed_json():
+    """
+    Tests that parse_json reports malformed JSON as a pydantic ValidationError.
+    """
+    parser = JsonStreamParser(Address)
+
+    with pytest.raises(ValidationError) as exc_info:
+        parser.parse_json(MALFORMED_ADDRESS_JSON)
+
+    assert exc_info.value.errors()[0]["type"] == "json_invalid"
+
+
+def test_split_surrogate_pair_escape_yields_none_until_complete():
+    """
+    Tests that a chunk ending between the halves of an escaped surrogate pair
+    yields None instead of a string holding a lone surrogate.
+    """
+    json_input = json.dumps({"title": "hi \U0001f600"})
+    parser = JsonStreamParser(Article)
+
+    titles = []
+    for chunk in chunk_string(json_input, 3):
+        result = parser.parse_chunk(chunk)
+        titles.append(result.title if result is not None else None)
+
+    assert titles == [
+        None,  # '{"t'
+        None,  # 'itl'
+        None,  # 'e":'
+        "h",  # ' "h'
+        "hi ",  # 'i \\'
+        None,  # 'ud8'
+        None,  # '3d\\' leaves the lone high surrogate \ud83d
+        None,  # 'ude'
+        "hi \U0001f600",  # '00"'
+        "hi \U0001f600",  # '}'
+    ]